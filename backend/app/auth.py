@@ -2,28 +2,55 @@
 
 JWT 토큰 생성/검증 및 비밀번호 해싱/검증 함수를 제공합니다.
 """
-from datetime import datetime, timedelta, timezone
+import logging
+import threading
+import time
+from datetime import timedelta
 from typing import Optional
 
+import jwt
+from argon2 import PasswordHasher, Type
+from argon2.exceptions import InvalidHashError, VerificationError
+from cachetools import TTLCache, cached
 from fastapi import Depends, HTTPException, status
-from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
-from passlib.context import CryptContext
-from sqlalchemy.orm import Session
-
-from app.config import JWT_SECRET_KEY, JWT_ALGORITHM, ACCESS_TOKEN_EXPIRE_MINUTES
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from jwt import InvalidTokenError
+from sqlalchemy import bindparam, lambda_stmt, select
+from sqlalchemy.orm import Session, undefer
+
+from app.config import (
+    JWT_SECRET_KEY,
+    JWT_ALGORITHM,
+    ACCESS_TOKEN_EXPIRE_MINUTES,
+    ARGON2_MEMORY_KIB,
+    ARGON2_TIME_COST,
+    ARGON2_PARALLELISM,
+)
 from app.database import get_db
-from app.models import User
+from app.models import User, UserRole
+
+logger = logging.getLogger(__name__)
 
-# 비밀번호 해싱 컨텍스트 (Argon2 사용)
+# 비밀번호 해셔 (Argon2 사용, argon2-cffi 직접 호출)
 # Argon2는 bcrypt의 72바이트 제한이 없고 더 안전합니다
-pwd_context = CryptContext(
-    schemes=["argon2"],
-    deprecated="auto"
+# 비용 파라미터는 환경변수로 조정하며, 권장 변형인 Argon2id를 사용합니다
+password_hasher = PasswordHasher(
+    time_cost=ARGON2_TIME_COST,
+    memory_cost=ARGON2_MEMORY_KIB,
+    parallelism=ARGON2_PARALLELISM,
+    type=Type.ID,
 )
 
-# OAuth2 Bearer 토큰 스킴
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
+# Bearer 토큰 스킴 (헤더가 없으면 None을 반환하고 401은 직접 발생)
+bearer_scheme = HTTPBearer(auto_error=False)
+
+# 인증 실패 예외 (내용이 고정이므로 모듈 로드 시 한 번만 생성)
+# 같은 인스턴스를 재사용하므로 raise 시 with_traceback(None)으로 이전 traceback이 쌓이지 않게 합니다
+CREDENTIALS_EXCEPTION = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Could not validate credentials",
+    headers={"WWW-Authenticate": "Bearer"},
+)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -36,7 +63,10 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         비밀번호 일치 여부
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    try:
+        return password_hasher.verify(hashed_password, plain_password)
+    except (VerificationError, InvalidHashError):
+        return False
 
 
 def get_password_hash(password: str) -> str:
@@ -48,7 +78,22 @@ def get_password_hash(password: str) -> str:
     Returns:
         해시된 비밀번호
     """
-    return pwd_context.hash(password)
+    return password_hasher.hash(password)
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """해시가 현재 Argon2 파라미터와 다른 설정으로 만들어졌는지 확인합니다.
+
+    로그인 성공 시 호출하여 이전 설정의 해시를 투명하게 갱신하는 데 사용합니다.
+
+    Args:
+        hashed_password: 저장된 해시 비밀번호
+
+    Returns:
+        재해싱 필요 여부
+    """
+    return password_hasher.check_needs_rehash(hashed_password)
+
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """JWT 액세스 토큰을 생성합니다.
@@ -61,15 +106,26 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         JWT 토큰 문자열
     """
     to_encode = data.copy()
+    # exp는 JWT NumericDate(UNIX 초)이므로 datetime 객체 없이 직접 계산
     if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
+        expire_seconds = int(expires_delta.total_seconds())
     else:
-        expire = datetime.now(timezone.utc) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    to_encode.update({"exp": expire})
+        expire_seconds = ACCESS_TOKEN_EXPIRE_MINUTES * 60
+    to_encode["exp"] = int(time.time()) + expire_seconds
     encoded_jwt = jwt.encode(to_encode, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
     return encoded_jwt
 
 
+# 토큰 디코딩 결과 캐시 (같은 토큰의 반복 서명 검증을 생략, 최대 60초 유지)
+_decode_cache = TTLCache(maxsize=10_000, ttl=60)
+
+
+@cached(_decode_cache, lock=threading.Lock())
+def _decode_cached(token: str) -> dict:
+    """서명을 검증하고 페이로드를 반환합니다. 검증 실패 시 예외는 캐시되지 않습니다."""
+    return jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
+
+
 def decode_access_token(token: str) -> Optional[dict]:
     """JWT 액세스 토큰을 디코딩합니다.
 
@@ -80,35 +136,55 @@ def decode_access_token(token: str) -> Optional[dict]:
         디코딩된 토큰 페이로드 또는 None (검증 실패 시)
     """
     try:
-        payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
-        return payload
-    except JWTError:
+        payload = _decode_cached(token)
+    except InvalidTokenError:
+        return None
+
+    # 캐시에 남아 있는 동안 만료된 토큰도 거부
+    exp = payload.get("exp")
+    if exp is not None and exp <= time.time():
         return None
+    return payload
+
+
+# 이메일로 사용자를 조회하는 미리 구성된 문장 (호출마다 SQL 구성/컴파일을 생략)
+_user_by_email_stmt = lambda_stmt(
+    lambda: select(User).where(User.email == bindparam("email"))
+)
+_user_with_password_by_email_stmt = lambda_stmt(
+    lambda: select(User)
+    .options(undefer(User.hashed_password))
+    .where(User.email == bindparam("email"))
+)
 
 
-def get_user_by_email(db: Session, email: str) -> Optional[User]:
+def get_user_by_email(
+    db: Session, email: str, with_password: bool = False
+) -> Optional[User]:
     """이메일로 사용자를 조회합니다.
 
     Args:
         db: 데이터베이스 세션
         email: 사용자 이메일
+        with_password: 지연 로딩되는 hashed_password를 함께 조회할지 여부
 
     Returns:
         User 객체 또는 None
     """
-    return db.query(User).filter(User.email == email).first()
+    stmt = _user_with_password_by_email_stmt if with_password else _user_by_email_stmt
+    return db.execute(stmt, {"email": email}).scalar_one_or_none()
 
 
-async def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
+def get_current_user(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme),
+    db: Session = Depends(get_db),
 ) -> User:
     """JWT 토큰에서 현재 사용자를 추출합니다.
 
     FastAPI 의존성 함수로 사용됩니다.
 
     Args:
-        token: JWT Bearer 토큰
+        credentials: Authorization 헤더의 Bearer 토큰 (없으면 None)
         db: 데이터베이스 세션
 
     Returns:
@@ -117,36 +193,23 @@ async def get_current_user(
     Raises:
         HTTPException: 토큰이 유효하지 않거나 사용자를 찾을 수 없는 경우
     """
-    print(f"[AUTH] get_current_user called with token: {token[:20]}...")
-
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-
-    payload = decode_access_token(token)
-    print(f"[AUTH] Decoded payload: {payload}")
+    if credentials is None:
+        raise CREDENTIALS_EXCEPTION.with_traceback(None)
 
+    payload = decode_access_token(credentials.credentials)
     if payload is None:
-        print("[AUTH] ERROR: Payload is None - token decode failed")
-        raise credentials_exception
+        raise CREDENTIALS_EXCEPTION.with_traceback(None)
 
     email: str = payload.get("sub")
-    print(f"[AUTH] Extracted email: {email}")
-
     if email is None:
-        print("[AUTH] ERROR: Email is None in payload")
-        raise credentials_exception
+        raise CREDENTIALS_EXCEPTION.with_traceback(None)
 
     user = get_user_by_email(db, email=email)
-    print(f"[AUTH] Found user: {user.username if user else 'None'}")
-
     if user is None:
-        print("[AUTH] ERROR: User not found in database")
-        raise credentials_exception
+        raise CREDENTIALS_EXCEPTION.with_traceback(None)
 
-    print(f"[AUTH] SUCCESS: User authenticated - {user.username}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("auth sub=%s", email)
     return user
 
 
@@ -154,101 +217,34 @@ async def get_current_user(
 # 역할 기반 권한 검증 의존성 함수
 # ============================================================
 
-async def get_current_admin_user(
-    current_user: User = Depends(get_current_user),
-) -> User:
-    """현재 사용자가 Admin인지 확인합니다.
+def require_roles(*roles: UserRole):
+    """허용된 역할만 통과시키는 FastAPI 의존성 함수를 생성합니다.
 
-    FastAPI 의존성 함수로 사용됩니다.
+    403 예외는 역할 조합마다 한 번만 생성하여 재사용합니다.
 
     Args:
-        current_user: 현재 로그인한 사용자
+        roles: 허용할 사용자 역할 목록
 
     Returns:
-        Admin 권한이 있는 User 객체
-
-    Raises:
-        HTTPException: Admin 권한이 없는 경우 403 Forbidden
-    """
-    from app.models.user import UserRole
-
-    if current_user.role != UserRole.admin:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Admin 권한이 필요합니다.",
-        )
-    return current_user
-
-
-async def get_current_admin_or_member(
-    current_user: User = Depends(get_current_user),
-) -> User:
-    """현재 사용자가 Admin 또는 Member인지 확인합니다.
-
-    FastAPI 의존성 함수로 사용됩니다.
-
-    Args:
-        current_user: 현재 로그인한 사용자
-
-    Returns:
-        Admin 또는 Member 권한이 있는 User 객체
-
-    Raises:
-        HTTPException: Admin/Member 권한이 없는 경우 403 Forbidden
-    """
-    from app.models.user import UserRole
-
-    if current_user.role not in [UserRole.admin, UserRole.member]:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Admin 또는 Member 권한이 필요합니다.",
-        )
-    return current_user
-
-
-def require_admin(current_user: User) -> User:
-    """Admin 권한 확인 유틸리티 함수.
-
-    엔드포인트 내부에서 호출하여 권한을 검증합니다.
-
-    Args:
-        current_user: 현재 로그인한 사용자
-
-    Returns:
-        Admin 권한이 있는 User 객체
-
-    Raises:
-        HTTPException: Admin 권한이 없는 경우 403 Forbidden
+        현재 사용자를 반환하는 의존성 함수 (권한이 없으면 403 Forbidden)
     """
-    from app.models.user import UserRole
-
-    if current_user.role != UserRole.admin:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Admin 권한이 필요합니다.",
-        )
-    return current_user
-
+    allowed_roles = frozenset(roles)
+    role_names = " 또는 ".join(role.value.capitalize() for role in roles)
+    forbidden_exception = HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail=f"{role_names} 권한이 필요합니다.",
+    )
 
-def require_admin_or_member(current_user: User) -> User:
-    """Admin 또는 Member 권한 확인 유틸리티 함수.
+    async def dependency(current_user: User = Depends(get_current_user)) -> User:
+        if current_user.role not in allowed_roles:
+            raise forbidden_exception.with_traceback(None)
+        return current_user
 
-    엔드포인트 내부에서 호출하여 권한을 검증합니다.
+    return dependency
 
-    Args:
-        current_user: 현재 로그인한 사용자
 
-    Returns:
-        Admin 또는 Member 권한이 있는 User 객체
+# Admin만 허용
+get_current_admin_user = require_roles(UserRole.admin)
 
-    Raises:
-        HTTPException: Admin/Member 권한이 없는 경우 403 Forbidden
-    """
-    from app.models.user import UserRole
-
-    if current_user.role not in [UserRole.admin, UserRole.member]:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Admin 또는 Member 권한이 필요합니다.",
-        )
-    return current_user
+# Admin 또는 Member만 허용
+get_current_admin_or_member = require_roles(UserRole.admin, UserRole.member)
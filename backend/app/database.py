@@ -1,12 +1,37 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
 SQLALCHEMY_DATABASE_URL = "sqlite:///./app.db"
 
 engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    query_cache_size=1200,  # 컴파일된 SQL 캐시 크기 (기본 500)
+    # 핸들러가 스레드풀에서 동시에 실행되므로 StaticPool(단일 연결 공유) 대신
+    # QueuePool을 동시 요청 수에 맞게 늘려 사용
+    pool_size=25,
+    max_overflow=25,
+    pool_recycle=1800,
 )
+
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragma(dbapi_connection, connection_record):
+    """연결마다 SQLite 설정 적용 (SQLite 전용)
+
+    - WAL 모드: 읽기와 쓰기가 서로 막지 않도록
+    - 외래키 검사: SQLite는 기본적으로 외래키 제약을 검사하지 않음
+    """
+    if engine.dialect.name != "sqlite":
+        return
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
@@ -2,6 +2,7 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy import insert, text
 
 from app.database import engine, Base, SessionLocal
 from app.routers import examples
@@ -15,6 +16,12 @@ from app.models import User, Category, Task  # noqa: F401
 
 # 데이터베이스 테이블 생성
 Base.metadata.create_all(bind=engine)
+# create_all은 이미 존재하는 테이블에 새로 추가된 인덱스를 만들지 않으므로 따로 확인
+for index in Task.__table__.indexes:
+    index.create(bind=engine, checkfirst=True)
+# ix_tasks_cat_order로 대체된 단일 컬럼 인덱스는 기존 DB에서도 제거하여 스키마를 맞춤
+with engine.begin() as conn:
+    conn.execute(text("DROP INDEX IF EXISTS ix_tasks_category_id"))
 
 
 # 기본 카테고리 데이터
@@ -30,23 +37,31 @@ def create_default_categories():
     """기본 카테고리가 없으면 생성"""
     db = SessionLocal()
     try:
-        # 카테고리가 하나도 없을 때만 기본 카테고리 생성
-        existing_count = db.query(Category).count()
-        if existing_count == 0:
-            for cat_data in DEFAULT_CATEGORIES:
-                category = Category(**cat_data)
-                db.add(category)
+        # 카테고리가 하나도 없을 때만 기본 카테고리 생성 (COUNT 대신 존재 여부만 확인)
+        has_categories = db.query(Category.id).first() is not None
+        if not has_categories:
+            db.execute(insert(Category), DEFAULT_CATEGORIES)
             db.commit()
             print(f"기본 카테고리 {len(DEFAULT_CATEGORIES)}개가 생성되었습니다.")
     finally:
         db.close()
 
 
+def load_first_user_flag():
+    """사용자 존재 여부를 확인하여 회원가입 시 첫 사용자 판별 쿼리를 생략"""
+    db = SessionLocal()
+    try:
+        auth.refresh_first_user_flag(db)
+    finally:
+        db.close()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """앱 시작/종료 시 실행되는 이벤트 핸들러"""
     # Startup
     create_default_categories()
+    load_first_user_flag()
     yield
     # Shutdown
     pass
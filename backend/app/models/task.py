@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
@@ -17,13 +17,17 @@ class TaskPriority(str, enum.Enum):
 class Task(Base):
     """태스크 모델"""
     __tablename__ = "tasks"
+    __table_args__ = (
+        # 카테고리 필터 + order 정렬, 카테고리별 MAX(order)를 인덱스만으로 처리
+        Index("ix_tasks_cat_order", "category_id", "order"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(200), nullable=False)
     description = Column(Text, nullable=True)
 
     # 외래키
-    category_id = Column(Integer, ForeignKey("categories.id"), nullable=False, index=True)
+    category_id = Column(Integer, ForeignKey("categories.id"), nullable=False)  # ix_tasks_cat_order로 인덱싱
     assigned_to = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)
     created_by = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
 
@@ -1,5 +1,5 @@
 from sqlalchemy import Column, Integer, String, DateTime, Enum as SQLEnum
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 from sqlalchemy.sql import func
 import enum
 
@@ -20,20 +20,23 @@ class User(Base):
     id = Column(Integer, primary_key=True, index=True)
     username = Column(String(50), unique=True, nullable=False, index=True)
     email = Column(String(255), unique=True, nullable=False, index=True)
-    hashed_password = Column(String(255), nullable=False)
+    # 로그인/비밀번호 변경 시에만 필요하므로 지연 로딩 (조회 시 undefer 사용)
+    hashed_password = deferred(Column(String(255), nullable=False))
     role = Column(SQLEnum(UserRole), default=UserRole.member, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
-    # 관계 설정: 사용자가 생성한 태스크들
+    # 관계 설정: 사용자가 생성한 태스크들 (의도치 않은 N+1 방지를 위해 지연 로딩 시 예외)
     created_tasks = relationship(
         "Task",
         back_populates="creator",
-        foreign_keys="Task.created_by"
+        foreign_keys="Task.created_by",
+        lazy="raise_on_sql",
     )
 
-    # 관계 설정: 사용자에게 할당된 태스크들
+    # 관계 설정: 사용자에게 할당된 태스크들 (의도치 않은 N+1 방지를 위해 지연 로딩 시 예외)
     assigned_tasks = relationship(
         "Task",
         back_populates="assignee",
-        foreign_keys="Task.assigned_to"
+        foreign_keys="Task.assigned_to",
+        lazy="raise_on_sql",
     )
@@ -3,6 +3,7 @@
 회원가입, 로그인, 현재 사용자 조회 엔드포인트를 제공합니다.
 """
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.database import get_db
@@ -12,6 +13,7 @@ from app.schemas.user import UserCreate, UserLogin, UserResponse, Token
 from app.auth import (
     get_password_hash,
     verify_password,
+    password_needs_rehash,
     create_access_token,
     get_user_by_email,
     get_current_user,
@@ -19,6 +21,25 @@ from app.auth import (
 
 router = APIRouter(prefix="/api/auth", tags=["auth"])
 
+# 존재하지 않는 이메일로 로그인할 때도 같은 Argon2 비용을 치르도록 하는 더미 해시
+# (응답 시간으로 가입 여부를 구분할 수 없게 함)
+DUMMY_HASH = get_password_hash("!")
+
+# 사용자가 한 명이라도 존재하는지 여부 (True가 되면 첫 사용자 판별 쿼리를 생략)
+_first_user_exists = False
+
+
+def refresh_first_user_flag(db: Session) -> None:
+    """DB를 확인하여 첫 사용자 존재 플래그를 갱신합니다.
+
+    앱 시작 시 lifespan에서 한 번 호출됩니다.
+
+    Args:
+        db: 데이터베이스 세션
+    """
+    global _first_user_exists
+    _first_user_exists = db.query(User.id).limit(1).first() is not None
+
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 def register(user_data: UserCreate, db: Session = Depends(get_db)):
@@ -36,28 +57,15 @@ def register(user_data: UserCreate, db: Session = Depends(get_db)):
     Raises:
         HTTPException 400: 이메일 또는 사용자명이 이미 존재하는 경우
     """
-    # 이메일 중복 검증
-    existing_user = get_user_by_email(db, user_data.email)
-    if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="이미 등록된 이메일입니다."
-        )
-
-    # 사용자명 중복 검증
-    existing_username = db.query(User).filter(User.username == user_data.username).first()
-    if existing_username:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="이미 사용 중인 사용자명입니다."
-        )
-
-    # 비밀번호 해싱 및 사용자 생성
+    # 비밀번호 해싱 및 사용자 생성 (def 핸들러이므로 Argon2 연산과 DB 작업 모두 스레드풀에서 실행됨)
     hashed_password = get_password_hash(user_data.password)
 
     # 첫 번째 사용자는 자동으로 admin으로 설정
-    user_count = db.query(User).count()
-    default_role = UserRole.admin if user_count == 0 else UserRole.member
+    global _first_user_exists
+    if not _first_user_exists:
+        refresh_first_user_flag(db)
+    is_first_user = not _first_user_exists
+    default_role = UserRole.admin if is_first_user else UserRole.member
 
     db_user = User(
         username=user_data.username,
@@ -66,8 +74,21 @@ def register(user_data: UserCreate, db: Session = Depends(get_db)):
         role=default_role
     )
 
+    # 이메일/사용자명 중복은 UNIQUE 인덱스로 검증 (사전 조회 없이 한 번에 INSERT)
     db.add(db_user)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError as e:
+        db.rollback()
+        if "email" in str(e.orig):
+            detail = "이미 등록된 이메일입니다."
+        else:
+            detail = "이미 사용 중인 사용자명입니다."
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=detail
+        )
+    _first_user_exists = True
     db.refresh(db_user)
 
     return db_user
@@ -90,22 +111,24 @@ def login(user_data: UserLogin, db: Session = Depends(get_db)):
         HTTPException 401: 이메일 또는 비밀번호가 올바르지 않은 경우
     """
     # 사용자 조회
-    user = get_user_by_email(db, user_data.email)
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="이메일 또는 비밀번호가 올바르지 않습니다.",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+    user = get_user_by_email(db, user_data.email, with_password=True)
 
     # 비밀번호 검증
-    if not verify_password(user_data.password, user.hashed_password):
+    # 사용자가 없어도 더미 해시로 검증하여 응답 시간을 동일하게 유지
+    hashed_password = user.hashed_password if user else DUMMY_HASH
+    password_ok = verify_password(user_data.password, hashed_password)
+    if not user or not password_ok:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="이메일 또는 비밀번호가 올바르지 않습니다.",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    # 이전 Argon2 설정으로 만들어진 해시는 현재 설정으로 갱신
+    if password_needs_rehash(user.hashed_password):
+        user.hashed_password = get_password_hash(user_data.password)
+        db.commit()
+
     # JWT 토큰 생성
     access_token = create_access_token(data={"sub": user.email})
 
@@ -124,4 +147,6 @@ async def get_me(current_user: User = Depends(get_current_user)):
     Returns:
         현재 사용자 정보
     """
+    # UserResponse에는 관계 필드가 없으므로 추가 로딩 없이 그대로 반환
+    # (created_tasks 등을 응답에 추가할 경우 selectinload로 함께 조회)
     return current_user
@@ -1,10 +1,11 @@
 """카테고리 API 라우터"""
 from fastapi import APIRouter, HTTPException, Depends, status
+from sqlalchemy import func, update
 from sqlalchemy.orm import Session
 
 from app.database import get_db
-from app.models import Category, User
-from app.models.user import UserRole
+from app.utils import get_or_404
+from app.models import Category, Task, User
 from app.schemas.category import (
     CategoryCreate,
     CategoryUpdate,
@@ -15,32 +16,30 @@ from app.auth import (
     get_current_user,
     get_current_admin_user,
     get_current_admin_or_member,
-    require_admin,
-    require_admin_or_member,
 )
 
 router = APIRouter(prefix="/api/categories", tags=["categories"])
 
 
 @router.get("/", response_model=list[CategoryResponse])
-async def get_categories(
+def get_categories(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """모든 카테고리 목록 반환 (order 기준 정렬)"""
+    # CategoryResponse에는 tasks가 없으므로 관계를 로드하지 않음
+    # (응답에 tasks를 추가할 경우 selectinload(Category.tasks)로 N+1 방지)
     categories = db.query(Category).order_by(Category.order).all()
     return categories
 
 
 @router.post("/", response_model=CategoryResponse, status_code=status.HTTP_201_CREATED)
-async def create_category(
+def create_category(
     category_data: CategoryCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_admin_or_member),
 ):
     """새 카테고리 생성 (Admin/Member만)"""
-    require_admin_or_member(current_user)
-
     # 이름 중복 확인
     existing = db.query(Category).filter(Category.name == category_data.name).first()
     if existing:
@@ -57,67 +56,56 @@ async def create_category(
 
 
 @router.put("/reorder", response_model=list[CategoryResponse])
-async def reorder_categories(
+def reorder_categories(
     reorder_data: CategoryReorder,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_admin_or_member),
 ):
     """여러 카테고리의 순서를 한번에 변경 (Admin/Member만)"""
-    require_admin_or_member(current_user)
-
-    updated_categories = []
-    for item in reorder_data.items:
-        category = db.query(Category).filter(Category.id == item.id).first()
-        if not category:
+    # 요청된 ID가 모두 존재하는지 한 번의 쿼리로 확인
+    requested_ids = [item.id for item in reorder_data.items]
+    existing_ids = {
+        id_ for (id_,) in db.query(Category.id).filter(Category.id.in_(requested_ids))
+    }
+    for category_id in requested_ids:
+        if category_id not in existing_ids:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"카테고리 ID {item.id}를 찾을 수 없습니다.",
+                detail=f"카테고리 ID {category_id}를 찾을 수 없습니다.",
             )
-        category.order = item.order
-        updated_categories.append(category)
 
-    db.commit()
-
-    # 업데이트된 카테고리들 새로고침 및 정렬된 전체 목록 반환
-    for cat in updated_categories:
-        db.refresh(cat)
+    # 기본키 기준 일괄 UPDATE (executemany 한 번으로 처리) 후 정렬된 전체 목록 반환
+    if reorder_data.items:
+        db.execute(
+            update(Category),
+            [{"id": item.id, "order": item.order} for item in reorder_data.items],
+        )
+        db.commit()
 
     all_categories = db.query(Category).order_by(Category.order).all()
     return all_categories
 
 
 @router.get("/{category_id}", response_model=CategoryResponse)
-async def get_category(
+def get_category(
     category_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """특정 카테고리 조회"""
-    category = db.query(Category).filter(Category.id == category_id).first()
-    if not category:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="카테고리를 찾을 수 없습니다.",
-        )
+    category = get_or_404(db, Category, category_id, "카테고리를 찾을 수 없습니다.")
     return category
 
 
 @router.put("/{category_id}", response_model=CategoryResponse)
-async def update_category(
+def update_category(
     category_id: int,
     category_data: CategoryUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_admin_or_member),
 ):
     """카테고리 수정 (Admin/Member만)"""
-    require_admin_or_member(current_user)
-
-    category = db.query(Category).filter(Category.id == category_id).first()
-    if not category:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="카테고리를 찾을 수 없습니다.",
-        )
+    category = get_or_404(db, Category, category_id, "카테고리를 찾을 수 없습니다.")
 
     # 이름 변경 시 중복 확인
     if category_data.name is not None and category_data.name != category.name:
@@ -128,11 +116,9 @@ async def update_category(
                 detail="이미 존재하는 카테고리 이름입니다.",
             )
 
-    # 제공된 필드만 업데이트
-    update_data = category_data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        if value is not None:
-            setattr(category, field, value)
+    # 요청에 포함된 필드만 업데이트 (명시적 null은 그대로 반영, 예: color 초기화)
+    for field in category_data.model_fields_set:
+        setattr(category, field, getattr(category_data, field))
 
     db.commit()
     db.refresh(category)
@@ -140,26 +126,24 @@ async def update_category(
 
 
 @router.delete("/{category_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_category(
+def delete_category(
     category_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_admin_user),
 ):
     """카테고리 삭제 (Admin만, 해당 카테고리에 일감이 있으면 에러)"""
-    require_admin(current_user)
-
-    category = db.query(Category).filter(Category.id == category_id).first()
-    if not category:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="카테고리를 찾을 수 없습니다.",
-        )
-
-    # 해당 카테고리에 속한 태스크가 있는지 확인
-    if category.tasks and len(category.tasks) > 0:
+    category = get_or_404(db, Category, category_id, "카테고리를 찾을 수 없습니다.")
+
+    # 해당 카테고리에 속한 태스크가 있는지 확인 (태스크를 로드하지 않고 COUNT만 조회)
+    task_count = (
+        db.query(func.count(Task.id))
+        .filter(Task.category_id == category_id)
+        .scalar()
+    )
+    if task_count > 0:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"카테고리에 {len(category.tasks)}개의 일감이 있어 삭제할 수 없습니다. 먼저 일감을 이동하거나 삭제해주세요.",
+            detail=f"카테고리에 {task_count}개의 일감이 있어 삭제할 수 없습니다. 먼저 일감을 이동하거나 삭제해주세요.",
         )
 
     db.delete(category)
@@ -1,9 +1,19 @@
 """일감(Task) API 라우터"""
-from fastapi import APIRouter, HTTPException, Depends, Query, status
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func
+import threading
+from collections import defaultdict
+
+from cachetools import TTLCache
+from fastapi import APIRouter, HTTPException, Depends, Query, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy import bindparam, event, exists, func, select, update
+from sqlalchemy.exc import IntegrityError
+from starlette.background import BackgroundTask
 
 from app.database import get_db
+from app.utils import get_or_404
 from app.models import Task, User, Category
 from app.models.user import UserRole
 from app.models.task import TaskPriority
@@ -12,118 +22,338 @@ from app.schemas.task import (
     TaskUpdate,
     TaskResponse,
     TaskMove,
+    TaskReorder,
+    CategoryTasksResponse,
 )
 from app.auth import (
     get_current_user,
     get_current_admin_or_member,
-    require_admin_or_member,
 )
 
 router = APIRouter(prefix="/api/tasks", tags=["tasks"])
 
+# 일감 작성/삭제가 허용되는 역할 (요청마다 리스트를 만들지 않도록 모듈 수준에 고정)
+_WRITE_ROLES = frozenset({UserRole.admin, UserRole.member})
+
+# 목록 응답을 pydantic-core에서 한 번에 검증/직렬화하기 위한 어댑터
+TASKS_ADAPTER = TypeAdapter(list[TaskResponse])
+CATEGORY_TASKS_ADAPTER = TypeAdapter(list[CategoryTasksResponse])
+
+
+# 반복 실행되는 조회문은 모듈 수준에서 한 번만 구성 (컴파일 캐시 키가 항상 동일)
+_task_with_relations_stmt = (
+    select(Task)
+    .options(
+        joinedload(Task.category),
+        joinedload(Task.assignee),
+        joinedload(Task.creator),
+        raiseload("*"),  # 응답 직렬화 중 누락된 관계의 지연 로딩(N+1)을 예외로 차단
+    )
+    .where(Task.id == bindparam("task_id"))
+)
+
 
 def get_task_with_relations(db: Session, task_id: int) -> Task | None:
     """관계를 포함하여 일감 조회"""
+    return db.execute(
+        _task_with_relations_stmt, {"task_id": task_id}
+    ).scalar_one_or_none()
+
+
+def next_order_expr(category_id: int):
+    """해당 카테고리의 다음 순서 값을 계산하는 스칼라 서브쿼리
+
+    INSERT 문 안에서 평가되므로 별도 SELECT 왕복이 없고, 동시 생성 시에도
+    조회와 삽입 사이에 다른 요청이 끼어들지 않습니다.
+    """
     return (
-        db.query(Task)
-        .options(
-            joinedload(Task.category),
-            joinedload(Task.assignee),
-            joinedload(Task.creator),
-        )
-        .filter(Task.id == task_id)
-        .first()
+        select(func.coalesce(func.max(Task.order), 0) + 1)
+        .where(Task.category_id == category_id)
+        .scalar_subquery()
     )
 
 
-def get_next_order(db: Session, category_id: int) -> int:
-    """해당 카테고리에서 다음 순서 값을 계산"""
-    max_order = (
-        db.query(func.max(Task.order))
-        .filter(Task.category_id == category_id)
-        .scalar()
-    )
-    return (max_order or 0) + 1
+# 카테고리/사용자 존재 확인 결과 캐시 (드물게 변경되므로 존재하는 ID만 60초간 보관)
+# 삭제 시에는 아래 after_delete 이벤트에서 즉시 제거합니다
+# 핸들러가 스레드풀에서 실행되므로 캐시 접근은 락으로 보호합니다
+_category_exists_cache = TTLCache(maxsize=4096, ttl=60)
+_user_exists_cache = TTLCache(maxsize=4096, ttl=60)
+_exists_cache_lock = threading.Lock()
+
+
+@event.listens_for(Category, "after_delete")
+def _evict_deleted_category(mapper, connection, target):
+    with _exists_cache_lock:
+        _category_exists_cache.pop(target.id, None)
+
+
+@event.listens_for(User, "after_delete")
+def _evict_deleted_user(mapper, connection, target):
+    with _exists_cache_lock:
+        _user_exists_cache.pop(target.id, None)
+
+
+def ensure_references_exist(
+    db: Session, category_id: int | None = None, assigned_to: int | None = None
+) -> None:
+    """카테고리/담당자 존재 여부를 한 번의 쿼리로 확인 (없으면 404, 캐시에 있으면 생략)"""
+    with _exists_cache_lock:
+        check_category = category_id is not None and category_id not in _category_exists_cache
+        check_assignee = assigned_to is not None and assigned_to not in _user_exists_cache
+
+    checks = []
+    if check_category:
+        checks.append(exists().where(Category.id == category_id).label("category"))
+    if check_assignee:
+        checks.append(exists().where(User.id == assigned_to).label("assignee"))
+    if not checks:
+        return
+
+    row = db.execute(select(*checks)).one()
+    if check_category:
+        if not row.category:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="카테고리를 찾을 수 없습니다.",
+            )
+        with _exists_cache_lock:
+            _category_exists_cache[category_id] = True
+    if check_assignee:
+        if not row.assignee:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="담당자를 찾을 수 없습니다.",
+            )
+        with _exists_cache_lock:
+            _user_exists_cache[assigned_to] = True
+
+
+def recheck_references(
+    db: Session, category_id: int | None = None, assigned_to: int | None = None
+) -> None:
+    """외래키 위반 시 캐시를 무시하고 다시 확인하여 해당하는 404 발생
+
+    캐시에 남은 ID가 다른 프로세스나 스크립트에서 삭제된 경우를 처리합니다.
+    참조 대상이 모두 존재하면 그대로 반환하므로 호출한 쪽에서 원래 예외를 다시 발생시킵니다.
+    """
+    db.rollback()
+    with _exists_cache_lock:
+        if category_id is not None:
+            _category_exists_cache.pop(category_id, None)
+        if assigned_to is not None:
+            _user_exists_cache.pop(assigned_to, None)
+    ensure_references_exist(db, category_id, assigned_to)
+
+
+def clear_exists_caches() -> None:
+    """카테고리/사용자 존재 확인 캐시를 비움 (테스트에서 DB를 초기화할 때 사용)"""
+    with _exists_cache_lock:
+        _category_exists_cache.clear()
+        _user_exists_cache.clear()
+
+
+# 목록 스트리밍 시 한 번에 불러와 직렬화할 행 수
+TASKS_STREAM_BATCH_SIZE = 500
+
+
+def _stream_tasks_json(stream_db: Session, result):
+    """이미 실행된 조회 결과를 배치 단위로 직렬화하여 JSON 배열 조각으로 내보냄
+
+    스트리밍이 끝나거나 중단되면 stream_db를 닫습니다.
+    """
+    try:
+        yield b"["
+        first = True
+        for tasks in result.scalars().partitions():
+            validated = TASKS_ADAPTER.validate_python(tasks, from_attributes=True)
+            # 배치별 배열의 대괄호를 떼어 하나의 배열로 이어 붙임
+            chunk = TASKS_ADAPTER.dump_json(validated)[1:-1]
+            if not first:
+                yield b","
+            yield chunk
+            first = False
+        yield b"]"
+    finally:
+        stream_db.close()
 
 
 @router.get("/", response_model=list[TaskResponse])
-async def get_tasks(
+def get_tasks(
     category_id: int | None = Query(default=None, description="카테고리 ID로 필터"),
     assigned_to: int | None = Query(default=None, description="담당자 ID로 필터"),
     priority: TaskPriority | None = Query(default=None, description="우선순위로 필터"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """일감 목록 반환 (선택적 필터링, category 내에서 order 기준 정렬)"""
-    query = (
-        db.query(Task)
-        .options(
-            joinedload(Task.category),
-            joinedload(Task.assignee),
-            joinedload(Task.creator),
-        )
+    """일감 목록 반환 (선택적 필터링, category 내에서 order 기준 정렬)
+
+    전체 결과를 메모리에 올리지 않고 배치 단위로 스트리밍합니다.
+    스트리밍이 끝날 때까지 DB 연결 하나를 사용합니다.
+    """
+    # 목록 조회는 JOIN으로 행을 넓히는 대신 관계별 IN 쿼리로 로드 (배치마다 관계별 1개 쿼리)
+    stmt = select(Task).options(
+        selectinload(Task.category),
+        selectinload(Task.assignee),
+        selectinload(Task.creator),
+        raiseload("*"),  # 응답 직렬화 중 누락된 관계의 지연 로딩(N+1)을 예외로 차단
     )
 
     # 필터 적용
     if category_id is not None:
-        query = query.filter(Task.category_id == category_id)
+        stmt = stmt.where(Task.category_id == category_id)
     if assigned_to is not None:
-        query = query.filter(Task.assigned_to == assigned_to)
+        stmt = stmt.where(Task.assigned_to == assigned_to)
     if priority is not None:
-        query = query.filter(Task.priority == priority)
+        stmt = stmt.where(Task.priority == priority)
 
     # category_id와 order로 정렬
-    tasks = query.order_by(Task.category_id, Task.order).all()
-    return tasks
+    stmt = stmt.order_by(Task.category_id, Task.order)
+
+    # get_db 세션은 응답 본문 전송 전에 닫히므로 같은 바인드로 스트리밍용 세션을 엽니다
+    # (get_db 오버라이드가 그대로 적용되고, 조회 오류는 응답 시작 전에 500으로 처리됨)
+    stream_db = Session(bind=db.get_bind())
+    try:
+        result = stream_db.execute(
+            stmt.execution_options(yield_per=TASKS_STREAM_BATCH_SIZE)
+        )
+    except Exception:
+        stream_db.close()
+        raise
+
+    # response_model은 문서용이며 실제 응답은 직접 직렬화한 JSON 스트림
+    # 본문 전송 전에 연결이 끊겨도 세션이 닫히도록 background에서도 close 호출
+    return StreamingResponse(
+        _stream_tasks_json(stream_db, result),
+        media_type="application/json",
+        background=BackgroundTask(stream_db.close),
+    )
 
 
-@router.post("/", response_model=TaskResponse, status_code=status.HTTP_201_CREATED)
-async def create_task(
-    task_data: TaskCreate,
+@router.get("/by-category", response_model=list[CategoryTasksResponse])
+def get_tasks_by_category(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """새 일감 생성 (Admin/Member만)"""
-    require_admin_or_member(current_user)
+    """카테고리별로 묶은 일감 목록 반환 (카테고리/일감 모두 order 기준 정렬)
 
-    # 카테고리 존재 확인
-    category = db.query(Category).filter(Category.id == task_data.category_id).first()
-    if not category:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="카테고리를 찾을 수 없습니다.",
+    칸반 보드가 그대로 렌더링할 수 있는 형태로, 일감마다 카테고리 정보를 반복하지 않습니다.
+    """
+    categories = db.query(Category).order_by(Category.order).all()
+    tasks = (
+        db.query(Task)
+        .options(
+            selectinload(Task.assignee),
+            selectinload(Task.creator),
+            raiseload("*"),
         )
+        .order_by(Task.category_id, Task.order)
+        .all()
+    )
 
-    # 담당자 존재 확인 (설정된 경우)
-    if task_data.assigned_to is not None:
-        assignee = db.query(User).filter(User.id == task_data.assigned_to).first()
-        if not assignee:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="담당자를 찾을 수 없습니다.",
-            )
+    # 카테고리별로 묶어 tasks 컬렉션에 직접 채움 (추가 지연 로딩 없음)
+    tasks_by_category = defaultdict(list)
+    for task in tasks:
+        tasks_by_category[task.category_id].append(task)
+    for category in categories:
+        set_committed_value(category, "tasks", tasks_by_category[category.id])
+
+    validated = CATEGORY_TASKS_ADAPTER.validate_python(categories, from_attributes=True)
+    return Response(CATEGORY_TASKS_ADAPTER.dump_json(validated), media_type="application/json")
+
+
+@router.post("/", response_model=TaskResponse, status_code=status.HTTP_201_CREATED)
+def create_task(
+    task_data: TaskCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin_or_member),
+):
+    """새 일감 생성 (Admin/Member만)"""
+    # 카테고리 및 담당자(설정된 경우) 존재 확인
+    ensure_references_exist(db, task_data.category_id, task_data.assigned_to)
 
     # 일감 데이터 준비
     task_dict = task_data.model_dump()
 
-    # order가 None이면 해당 카테고리의 마지막 순서로 설정
+    # order가 None이면 해당 카테고리의 마지막 순서로 설정 (INSERT 시 DB에서 계산)
     if task_dict.get("order") is None:
-        task_dict["order"] = get_next_order(db, task_data.category_id)
+        task_dict["order"] = next_order_expr(task_data.category_id)
 
     # created_by는 현재 사용자로 자동 설정
     task_dict["created_by"] = current_user.id
 
     task = Task(**task_dict)
     db.add(task)
+    try:
+        db.flush()
+    except IntegrityError:
+        recheck_references(db, task_data.category_id, task_data.assigned_to)
+        raise
+    task_id = task.id  # 커밋 후에는 속성이 만료되므로 flush 직후 ID 보관
     db.commit()
-    db.refresh(task)
 
-    # 관계 포함하여 반환
-    return get_task_with_relations(db, task.id)
+    # 만료된 task를 관계와 함께 한 번의 조회로 다시 채움 (별도 refresh 없음)
+    return get_task_with_relations(db, task_id)
+
+
+@router.put("/reorder", response_model=list[TaskResponse])
+def reorder_tasks(
+    reorder_data: TaskReorder,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin_or_member),
+):
+    """여러 일감의 카테고리/순서를 한번에 변경 (Admin/Member만, 드래그 앤 드롭용)"""
+    # 요청된 일감과 대상 카테고리가 모두 존재하는지 각각 한 번의 쿼리로 확인
+    task_ids = [item.id for item in reorder_data.items]
+    existing_task_ids = {
+        id_ for (id_,) in db.query(Task.id).filter(Task.id.in_(task_ids))
+    }
+    for task_id in task_ids:
+        if task_id not in existing_task_ids:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"일감 ID {task_id}를 찾을 수 없습니다.",
+            )
+
+    category_ids = {item.category_id for item in reorder_data.items}
+    existing_category_ids = {
+        id_ for (id_,) in db.query(Category.id).filter(Category.id.in_(category_ids))
+    }
+    for category_id in category_ids:
+        if category_id not in existing_category_ids:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"카테고리 ID {category_id}를 찾을 수 없습니다.",
+            )
+
+    # 기본키 기준 일괄 UPDATE (executemany 한 번으로 처리)
+    if reorder_data.items:
+        db.execute(
+            update(Task),
+            [
+                {"id": item.id, "category_id": item.category_id, "order": item.order}
+                for item in reorder_data.items
+            ],
+        )
+        db.commit()
+
+    # 변경된 일감들을 관계 포함하여 반환
+    tasks = (
+        db.query(Task)
+        .options(
+            selectinload(Task.category),
+            selectinload(Task.assignee),
+            selectinload(Task.creator),
+            raiseload("*"),
+        )
+        .filter(Task.id.in_(task_ids))
+        .order_by(Task.category_id, Task.order)
+        .all()
+    )
+    return tasks
 
 
 @router.get("/{task_id}", response_model=TaskResponse)
-async def get_task(
+def get_task(
     task_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -139,69 +369,60 @@ async def get_task(
 
 
 @router.put("/{task_id}", response_model=TaskResponse)
-async def update_task(
+def update_task(
     task_id: int,
     task_data: TaskUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_admin_or_member),
 ):
     """일감 수정 (Admin/Member만)"""
-    require_admin_or_member(current_user)
-
-    task = db.query(Task).filter(Task.id == task_id).first()
-    if not task:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="일감을 찾을 수 없습니다.",
-        )
-
-    # 카테고리 변경 시 존재 확인
-    if task_data.category_id is not None:
-        category = db.query(Category).filter(Category.id == task_data.category_id).first()
-        if not category:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="카테고리를 찾을 수 없습니다.",
-            )
+    # 카테고리/담당자 변경 시 존재 확인
+    ensure_references_exist(db, task_data.category_id, task_data.assigned_to)
 
-    # 담당자 변경 시 존재 확인
-    if task_data.assigned_to is not None:
-        assignee = db.query(User).filter(User.id == task_data.assigned_to).first()
-        if not assignee:
+    # 제공된 필드만 UPDATE 한 번으로 반영 (ORM 객체를 먼저 로드하지 않음)
+    # 세션에 로드된 Task가 없으므로 identity map 동기화도 생략
+    update_data = task_data.model_dump(exclude_unset=True)
+    if update_data:
+        try:
+            updated_id = db.execute(
+                update(Task)
+                .where(Task.id == task_id)
+                .values(**update_data)
+                .returning(Task.id)
+                .execution_options(synchronize_session=False)
+            ).scalar_one_or_none()
+        except IntegrityError:
+            recheck_references(db, task_data.category_id, task_data.assigned_to)
+            raise
+        if updated_id is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
-                detail="담당자를 찾을 수 없습니다.",
+                detail="일감을 찾을 수 없습니다.",
             )
-
-    # 제공된 필드만 업데이트
-    update_data = task_data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(task, field, value)
-
-    db.commit()
-    db.refresh(task)
+        db.commit()
 
     # 관계 포함하여 반환
-    return get_task_with_relations(db, task.id)
+    task = get_task_with_relations(db, task_id)
+    if not task:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="일감을 찾을 수 없습니다.",
+        )
+    return task
 
 
 @router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_task(
+def delete_task(
     task_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """일감 삭제 (Admin/Member/본인만)"""
-    task = db.query(Task).filter(Task.id == task_id).first()
-    if not task:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="일감을 찾을 수 없습니다.",
-        )
+    task = get_or_404(db, Task, task_id, "일감을 찾을 수 없습니다.")
 
     # 권한 확인: Admin, Member, 또는 본인(생성자)만 삭제 가능
     is_creator = task.created_by == current_user.id
-    is_admin_or_member = current_user.role in [UserRole.admin, UserRole.member]
+    is_admin_or_member = current_user.role in _WRITE_ROLES
 
     if not (is_admin_or_member or is_creator):
         raise HTTPException(
@@ -215,36 +436,34 @@ async def delete_task(
 
 
 @router.put("/{task_id}/move", response_model=TaskResponse)
-async def move_task(
+def move_task(
     task_id: int,
     move_data: TaskMove,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_admin_or_member),
 ):
     """일감을 다른 카테고리로 이동 또는 순서 변경 (Admin/Member만)"""
-    require_admin_or_member(current_user)
-
-    task = db.query(Task).filter(Task.id == task_id).first()
-    if not task:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="일감을 찾을 수 없습니다.",
-        )
-
     # 대상 카테고리 존재 확인
-    category = db.query(Category).filter(Category.id == move_data.category_id).first()
-    if not category:
+    ensure_references_exist(db, category_id=move_data.category_id)
+
+    # 카테고리와 순서 업데이트 (ORM 객체를 먼저 로드하지 않으므로 identity map 동기화도 생략)
+    try:
+        updated_id = db.execute(
+            update(Task)
+            .where(Task.id == task_id)
+            .values(category_id=move_data.category_id, order=move_data.order)
+            .returning(Task.id)
+            .execution_options(synchronize_session=False)
+        ).scalar_one_or_none()
+    except IntegrityError:
+        recheck_references(db, category_id=move_data.category_id)
+        raise
+    if updated_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="카테고리를 찾을 수 없습니다.",
+            detail="일감을 찾을 수 없습니다.",
         )
-
-    # 카테고리와 순서 업데이트
-    task.category_id = move_data.category_id
-    task.order = move_data.order
-
     db.commit()
-    db.refresh(task)
 
     # 관계 포함하여 반환
-    return get_task_with_relations(db, task.id)
+    return get_task_with_relations(db, task_id)
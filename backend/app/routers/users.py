@@ -3,10 +3,13 @@
 담당자 선택 등을 위한 사용자 목록 조회 API를 제공합니다.
 Admin 전용 사용자 관리 기능도 포함합니다.
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from pydantic import TypeAdapter
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.database import get_db
+from app.utils import get_or_404
 from app.models import User
 from app.schemas.user import UserResponse, UserRoleUpdate
 from app.auth import (
@@ -16,9 +19,17 @@ from app.auth import (
 
 router = APIRouter(prefix="/api/users", tags=["users"])
 
+# 목록 응답을 pydantic-core에서 한 번에 검증/직렬화하기 위한 어댑터
+USERS_ADAPTER = TypeAdapter(list[UserResponse])
+
+# 목록 조회 시 UserResponse가 사용하는 컬럼만 선택 (ORM 객체 생성 생략)
+_user_list_stmt = select(
+    User.id, User.username, User.email, User.role, User.created_at
+)
+
 
 @router.get("/", response_model=list[UserResponse])
-async def get_users(
+def get_users(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -29,15 +40,18 @@ async def get_users(
     Returns:
         list[UserResponse]: 사용자 목록 (id, username, email, role, created_at)
     """
-    users = db.query(User).all()
-    return users
+    users = db.execute(_user_list_stmt).all()
+
+    # Response를 직접 반환하면 FastAPI의 항목별 검증/인코딩을 건너뜀 (response_model은 문서용)
+    validated = USERS_ADAPTER.validate_python(users, from_attributes=True)
+    return Response(USERS_ADAPTER.dump_json(validated), media_type="application/json")
 
 
 @router.get("/{user_id}", response_model=UserResponse)
-async def get_user(
+def get_user(
     user_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
 ):
     """특정 사용자 정보를 반환합니다.
 
@@ -50,17 +64,12 @@ async def get_user(
     Raises:
         HTTPException: 사용자를 찾을 수 없는 경우 404
     """
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="사용자를 찾을 수 없습니다.",
-        )
-    return user
+    # 본인 조회는 get_current_user와 같은 세션의 identity map에서 DB 질의 없이 반환
+    return get_or_404(db, User, user_id, "사용자를 찾을 수 없습니다.")
 
 
 @router.put("/{user_id}/role", response_model=UserResponse)
-async def update_user_role(
+def update_user_role(
     user_id: int,
     role_data: UserRoleUpdate,
     db: Session = Depends(get_db),
@@ -84,12 +93,7 @@ async def update_user_role(
             detail="자신의 역할은 변경할 수 없습니다.",
         )
 
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="사용자를 찾을 수 없습니다.",
-        )
+    user = get_or_404(db, User, user_id, "사용자를 찾을 수 없습니다.")
 
     user.role = role_data.role
     db.commit()
@@ -98,7 +102,7 @@ async def update_user_role(
 
 
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_user(
+def delete_user(
     user_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_admin_user)
@@ -117,12 +121,7 @@ async def delete_user(
             detail="자신의 계정은 삭제할 수 없습니다.",
         )
 
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="사용자를 찾을 수 없습니다.",
-        )
+    user = get_or_404(db, User, user_id, "사용자를 찾을 수 없습니다.")
 
     db.delete(user)
     db.commit()
@@ -1,5 +1,12 @@
 from app.schemas.example import ExampleCreate, ExampleResponse
-from app.schemas.user import UserCreate, UserLogin, UserResponse, Token, TokenData
+from app.schemas.user import (
+    UserCreate,
+    UserLogin,
+    UserResponse,
+    UserRoleUpdate,
+    Token,
+    TokenData,
+)
 from app.schemas.category import (
     CategoryBase,
     CategoryCreate,
@@ -12,8 +19,12 @@ from app.schemas.task import (
     TaskBase,
     TaskCreate,
     TaskUpdate,
+    TaskSummaryResponse,
     TaskResponse,
+    CategoryTasksResponse,
     TaskMove,
+    TaskReorderItem,
+    TaskReorder,
     TaskFilter,
 )
 
@@ -23,6 +34,7 @@ __all__ = [
     "UserCreate",
     "UserLogin",
     "UserResponse",
+    "UserRoleUpdate",
     "Token",
     "TokenData",
     "CategoryBase",
@@ -34,7 +46,11 @@ __all__ = [
     "TaskBase",
     "TaskCreate",
     "TaskUpdate",
+    "TaskSummaryResponse",
     "TaskResponse",
+    "CategoryTasksResponse",
     "TaskMove",
+    "TaskReorderItem",
+    "TaskReorder",
     "TaskFilter",
 ]
@@ -1,6 +1,6 @@
 """카테고리 관련 Pydantic 스키마"""
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class CategoryBase(BaseModel):
@@ -21,6 +21,14 @@ class CategoryUpdate(BaseModel):
     order: int | None = Field(default=None, ge=0, description="보드 내 순서")
     color: str | None = Field(default=None, max_length=20, description="UI 색상 코드")
 
+    @field_validator("name", "order")
+    @classmethod
+    def reject_null(cls, value):
+        """name/order는 DB에서 NOT NULL이므로 명시적 null을 거부"""
+        if value is None:
+            raise ValueError("null로 설정할 수 없습니다.")
+        return value
+
 
 class CategoryResponse(BaseModel):
     """카테고리 응답 스키마"""
@@ -30,8 +38,7 @@ class CategoryResponse(BaseModel):
     color: str | None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class CategoryReorderItem(BaseModel):
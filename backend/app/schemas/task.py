@@ -1,6 +1,6 @@
 """일감(Task) 관련 Pydantic 스키마"""
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.models.task import TaskPriority
 from app.schemas.user import UserResponse
@@ -39,8 +39,8 @@ class TaskUpdate(BaseModel):
     order: int | None = Field(default=None, ge=0, description="카테고리 내 순서")
 
 
-class TaskResponse(BaseModel):
-    """일감 응답 스키마"""
+class TaskSummaryResponse(BaseModel):
+    """카테고리 정보를 제외한 일감 응답 스키마 (카테고리별 묶음 응답에서 사용)"""
     id: int
     title: str
     description: str | None
@@ -55,12 +55,20 @@ class TaskResponse(BaseModel):
     updated_at: datetime
 
     # 관계 포함
-    category: CategoryResponse | None = None
     assignee: UserResponse | None = None
     creator: UserResponse | None = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+class TaskResponse(TaskSummaryResponse):
+    """일감 응답 스키마"""
+    category: CategoryResponse | None = None
+
+
+class CategoryTasksResponse(CategoryResponse):
+    """카테고리별 일감 묶음 응답 스키마 (칸반 보드용)"""
+    tasks: list[TaskSummaryResponse] = Field(default_factory=list, description="order 기준 정렬된 일감 목록")
 
 
 class TaskMove(BaseModel):
@@ -69,6 +77,18 @@ class TaskMove(BaseModel):
     order: int = Field(..., ge=0, description="카테고리 내 새로운 순서")
 
 
+class TaskReorderItem(BaseModel):
+    """개별 일감 이동/순서 변경 아이템"""
+    id: int = Field(..., description="일감 ID")
+    category_id: int = Field(..., description="이동할 카테고리 ID")
+    order: int = Field(..., ge=0, description="카테고리 내 새로운 순서")
+
+
+class TaskReorder(BaseModel):
+    """일감 이동/순서 일괄 변경 요청 스키마"""
+    items: list[TaskReorderItem] = Field(..., description="ID, 카테고리, 순서 매핑 리스트")
+
+
 class TaskFilter(BaseModel):
     """일감 필터링 스키마"""
     category_id: int | None = Field(default=None, description="카테고리 ID로 필터")
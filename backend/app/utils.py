@@ -0,0 +1,31 @@
+"""라우터 공용 유틸리티 모듈"""
+from typing import TypeVar
+
+from fastapi import HTTPException, status
+from sqlalchemy.orm import Session
+
+ModelT = TypeVar("ModelT")
+
+
+def get_or_404(db: Session, model: type[ModelT], id_: int, detail: str) -> ModelT:
+    """기본키로 객체를 조회하고, 없으면 404 에러를 발생시킵니다.
+
+    Session.get을 사용하므로 같은 세션에서 이미 로드된 객체는 DB 질의 없이
+    identity map에서 바로 반환됩니다.
+
+    Args:
+        db: 데이터베이스 세션
+        model: 조회할 ORM 모델 클래스
+        id_: 기본키 값
+        detail: 404 응답 메시지
+
+    Returns:
+        조회된 ORM 객체
+
+    Raises:
+        HTTPException: 객체를 찾을 수 없는 경우 404
+    """
+    obj = db.get(model, id_)
+    if obj is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=detail)
+    return obj
@@ -0,0 +1,73 @@
+"""Argon2 비용 파라미터 보정 스크립트
+
+배포 서버에서 실행하여 해시 1회가 목표 시간(기본 50ms)을 넘기 직전까지
+memory_cost를 두 배씩 늘려가며 측정하고, 선택된 값을 .env 파일에 기록합니다.
+
+사용법:
+    cd backend && python scripts/calibrate_argon2.py --target-ms 50
+"""
+import argparse
+import time
+from pathlib import Path
+
+from argon2 import PasswordHasher, Type
+
+ENV_PATH = Path(__file__).resolve().parent.parent / ".env"
+SAMPLES = 5
+
+
+def measure_ms(memory_cost: int, time_cost: int, parallelism: int) -> float:
+    """주어진 파라미터로 해시 1회에 걸리는 평균 시간(ms)을 측정합니다."""
+    hasher = PasswordHasher(
+        time_cost=time_cost,
+        memory_cost=memory_cost,
+        parallelism=parallelism,
+        type=Type.ID,
+    )
+    hasher.hash("calibration-password")  # 워밍업
+    start = time.perf_counter()
+    for _ in range(SAMPLES):
+        hasher.hash("calibration-password")
+    return (time.perf_counter() - start) * 1000 / SAMPLES
+
+
+def write_env(values: dict[str, int]) -> None:
+    """기존 .env 내용을 유지하면서 Argon2 설정 값만 갱신합니다."""
+    lines = ENV_PATH.read_text().splitlines() if ENV_PATH.exists() else []
+    lines = [line for line in lines if line.split("=", 1)[0].strip() not in values]
+    lines += [f"{key}={value}" for key, value in values.items()]
+    ENV_PATH.write_text("\n".join(lines) + "\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Argon2 비용 파라미터 보정")
+    parser.add_argument("--target-ms", type=float, default=50.0, help="해시 1회 목표 시간 (ms)")
+    parser.add_argument("--time-cost", type=int, default=2, help="반복 횟수 (time_cost)")
+    parser.add_argument("--parallelism", type=int, default=1, help="병렬도 (parallelism)")
+    parser.add_argument("--dry-run", action="store_true", help=".env에 기록하지 않고 결과만 출력")
+    args = parser.parse_args()
+
+    # 최소 8MiB부터 시작하여 목표 시간을 초과하기 직전 값을 선택
+    memory_cost = 8 * 1024
+    chosen = memory_cost
+    while True:
+        elapsed = measure_ms(memory_cost, args.time_cost, args.parallelism)
+        print(f"memory_cost={memory_cost} KiB -> {elapsed:.1f}ms")
+        if elapsed > args.target_ms:
+            break
+        chosen = memory_cost
+        memory_cost *= 2
+
+    values = {
+        "ARGON2_MEMORY_KIB": chosen,
+        "ARGON2_TIME_COST": args.time_cost,
+        "ARGON2_PARALLELISM": args.parallelism,
+    }
+    print(f"선택된 설정: {values}")
+    if not args.dry_run:
+        write_env(values)
+        print(f"{ENV_PATH}에 저장되었습니다.")
+
+
+if __name__ == "__main__":
+    main()
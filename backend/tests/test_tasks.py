@@ -0,0 +1,110 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import sessionmaker
+
+from app.main import app
+from app.database import Base, get_db
+from app.models import Category, Task, User
+from app.models.user import UserRole
+from app.routers.tasks import clear_exists_caches, get_task_with_relations
+from app.schemas.task import TaskResponse
+
+# 테스트용 DB 설정
+TEST_DATABASE_URL = "sqlite:///./test.db"
+test_engine = create_engine(TEST_DATABASE_URL, connect_args={"check_same_thread": False})
+TestSessionLocal = sessionmaker(bind=test_engine)
+
+
+def override_get_db():
+    db = TestSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+app.dependency_overrides[get_db] = override_get_db
+client = TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def setup_db():
+    Base.metadata.create_all(bind=test_engine)
+    yield
+    Base.metadata.drop_all(bind=test_engine)
+    # 테이블을 지우면 ID가 재사용되므로 존재 확인 캐시도 비움
+    clear_exists_caches()
+
+
+def create_sample_task() -> int:
+    """사용자, 카테고리, 일감을 하나씩 만들고 일감 ID를 반환"""
+    db = TestSessionLocal()
+    try:
+        user = User(username="tester", email="tester@test.com", hashed_password="x", role=UserRole.admin)
+        category = Category(name="ToDo", order=0)
+        db.add_all([user, category])
+        db.flush()
+        task = Task(title="일감", category_id=category.id, assigned_to=user.id, created_by=user.id)
+        db.add(task)
+        db.commit()
+        return task.id
+    finally:
+        db.close()
+
+
+# 테스트 케이스
+class TestTaskEagerLoading:
+    def test_task_with_relations_validates(self):
+        """get_task_with_relations 결과는 추가 로딩 없이 TaskResponse로 변환됨"""
+        task_id = create_sample_task()
+
+        db = TestSessionLocal()
+        try:
+            task = get_task_with_relations(db, task_id)
+            response = TaskResponse.model_validate(task)
+        finally:
+            db.close()
+
+        assert response.id == task_id
+        assert response.category.name == "ToDo"
+        assert response.assignee.username == "tester"
+        assert response.creator.username == "tester"
+
+    def test_unloaded_relationship_raises(self):
+        """조회문이 미리 로드하지 않은 관계에 접근하면 쿼리 대신 예외 발생"""
+        task_id = create_sample_task()
+
+        db = TestSessionLocal()
+        try:
+            task = get_task_with_relations(db, task_id)
+            with pytest.raises(InvalidRequestError):
+                task.creator.created_tasks
+        finally:
+            db.close()
+
+
+class TestTaskAPI:
+    def test_get_tasks_uses_overridden_db(self):
+        """목록 스트리밍도 get_db 오버라이드의 DB를 조회함"""
+        client.post(
+            "/api/auth/register",
+            json={"username": "admin", "email": "admin@test.com", "password": "secret1"},
+        )
+        login_res = client.post(
+            "/api/auth/login",
+            json={"email": "admin@test.com", "password": "secret1"},
+        )
+        headers = {"Authorization": f"Bearer {login_res.json()['access_token']}"}
+
+        category_res = client.post("/api/categories/", json={"name": "ToDo", "order": 0}, headers=headers)
+        client.post(
+            "/api/tasks/",
+            json={"title": "테스트 일감", "category_id": category_res.json()["id"]},
+            headers=headers,
+        )
+
+        response = client.get("/api/tasks/", headers=headers)
+        assert response.status_code == 200
+        assert [task["title"] for task in response.json()] == ["테스트 일감"]